@@ -5,29 +5,142 @@ Allows users to specify any chapter and verse combination and provides comprehen
 focused only on those matching passages across the entire Bible.
 """
 
+import contextlib
+import io
 import json
+import mmap
+import os
+import pickle
+import stat
 import sys
+import tempfile
 from pathlib import Path
 from collections import defaultdict, Counter
 import re
+import statistics
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when installed
+    orjson = None
+
+# Bumped whenever the layout of the cached passage index changes
+_INDEX_CACHE_VERSION = 1
+
+
+# Reference strings in the format: "Book Title Chapter:Verse"
+_REF_RE = re.compile(r'^(.+?) (\d+):(\d+)$')
+
+# Precompiled patterns shared by the per-passage analysis loops
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_INT_RE = re.compile(r'\d+')
+_BOUNDED_INT_RE = re.compile(r'\b\d+\b')
+_WORD_RE = re.compile(r'\b\w+\b')
+_NON_WORD_SPACE_RE = re.compile(r'[^\w\s]')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Translation table deleting every ASCII character matched by _NON_WORD_SPACE_RE
+_NON_WORD_SPACE_DELETE = str.maketrans('', '', ''.join(
+    char for char in map(chr, range(128)) if _NON_WORD_SPACE_RE.match(char)
+))
+
+# Seven-related word patterns, grouped by category
+_SEVEN_PATTERNS = [
+    (category, re.compile(pattern))
+    for category, patterns in (
+        ('basic', [r'\bseven\b', r'\bseventh\b', r'\bseventy\b', r'\bseventeen\b']),
+        ('compounds', [r'\bseventy-seven\b', r'\bseven-fold\b', r'\bsevenfold\b']),
+        ('related', [r'\bweek\b', r'\bsabbath\b', r'\bheptad\b', r'\brest\b'])
+    )
+    for pattern in patterns
+]
+
+# Single alternation over every seven pattern, so passages without any hit are
+# rejected in one scan. The patterns overlap (e.g. "seventy-seven" also holds
+# "seventy" and "seven"), so hits are still counted per pattern afterwards.
+_SEVEN_ANY_RE = re.compile('|'.join(pattern.pattern for _, pattern in _SEVEN_PATTERNS))
+
+# Biblical seven terms (common in scripture)
+_BIBLICAL_SEVEN_TERMS = [
+    'seven days', 'seven years', 'seven times', 'seven lamps',
+    'seven spirits', 'seven churches', 'seven seals', 'seven trumpets',
+    'seven bowls', 'seven heads', 'seven horns', 'seven eyes',
+    'seven stars', 'seven candlesticks', 'seven angels', 'seven thunders'
+]
+_BIBLICAL_SEVEN_TERMS_RE = re.compile('|'.join(map(re.escape, _BIBLICAL_SEVEN_TERMS)))
+
+# Ordinal numbers divisible by 7. These overlap ("seventh" is inside
+# "seventy-seventh"), so each one is located with its own str.find.
+_ORDINALS_DIV_7 = [
+    'seventh', 'fourteenth', 'twenty-first', 'twenty-eighth',
+    'thirty-fifth', 'forty-second', 'forty-ninth', 'fifty-sixth',
+    'sixty-third', 'seventieth', 'seventy-seventh'
+]
+
 
 class InteractiveBibleAnalytics:
     """Class to handle interactive Bible data analysis and statistics."""
     
-    def __init__(self, bible_data):
+    def __init__(self, bible_data, index=None):
         """
         Initialize with Bible data.
         
+        Only the parsed references, the (chapter, verse) index and the ordered
+        book titles are kept; the decoded JSON document itself is not retained.
+        
         Args:
-            bible_data (dict): Dictionary containing Bible verses
+            bible_data (dict): Dictionary containing Bible verses, either keyed by
+                reference ("Book Title Chapter:Verse") or nested under 'books'
+            index (tuple, optional): Previously built (parsed_references, book_titles,
+                passage_index), e.g. from the index cache; bible_data is then unused
         """
-        self.bible_data = bible_data
+        if index is not None:
+            self.parsed_references, self.book_titles, self.passage_index = index
+        else:
+            self.parsed_references = {}
+            # Book titles in Bible order (a dict used as an ordered set), so the
+            # book lists in the report follow the canonical order
+            self.book_titles = {}
+            self.passage_index = self._build_passage_index(bible_data)
         self.target_chapter = None
         self.target_verse = None
         self.matching_passages = {}
+        self.cleaned_passages = {}
+        self.lowered_passages = {}
+        self.passage_lengths = []
+        self.word_counts = []
         self.analytics = {}
+    
+    def _iter_verses(self, bible_data):
+        """Yield (reference, book, chapter, verse, text) for every verse in the data."""
+        if 'books' in bible_data:
+            for book in bible_data['books']:
+                book_title = book['title']
+                for chapter in book['chapters']:
+                    chapter_num = chapter['chapter']
+                    for verse in chapter['verses']:
+                        verse_num = verse['verse']
+                        # Construct reference in the format: "Book Title Chapter:Verse"
+                        reference = f"{book_title} {chapter_num}:{verse_num}"
+                        yield reference, book_title, chapter_num, verse_num, verse['text']
+        else:
+            for reference, text in bible_data.items():
+                match = _REF_RE.match(reference)
+                if match:
+                    book_title, chapter_num, verse_num = match.groups()
+                    yield reference, book_title, int(chapter_num), int(verse_num), text
+    
+    def _build_passage_index(self, bible_data):
+        """Parse every reference once and group verses by (chapter, verse)."""
+        # (reference, text) pairs are appended in Bible order; references are
+        # unique, so the buckets need no hashing
+        passage_index = defaultdict(list)
+        for reference, book_title, chapter_num, verse_num, text in self._iter_verses(bible_data):
+            self.parsed_references[reference] = (book_title, chapter_num, verse_num)
+            self.book_titles[book_title] = None
+            passage_index[(chapter_num, verse_num)].append((reference, text))
+        return passage_index
         
     def get_user_input(self):
         """Get chapter and verse from user input."""
@@ -62,6 +175,15 @@ class InteractiveBibleAnalytics:
                 print(f"❌ Error: {e}")
                 continue
     
+    def ask_another_query(self):
+        """Ask whether to analyze another chapter and verse."""
+        try:
+            answer = input("\n🔁 Analyze another chapter and verse? (y/n): ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print("\n\n👋 Goodbye!")
+            return False
+        return answer in ('y', 'yes')
+    
     def extract_matching_passages(self):
         """Extract all passages matching the specified chapter and verse."""
         print(f" Extracting Chapter {self.target_chapter}, Verse {self.target_verse} passages...")
@@ -69,45 +191,41 @@ class InteractiveBibleAnalytics:
         target_chapter = int(self.target_chapter)
         target_verse = int(self.target_verse)
         
-        for book in self.bible_data['books']:
-            book_title = book['title']
-            for chapter in book['chapters']:
-                chapter_num = chapter['chapter']
-                
-                # Check if this matches the target chapter
-                if chapter_num == target_chapter:
-                    for verse in chapter['verses']:
-                        verse_num = verse['verse']
-                        
-                        # Check if this matches the target verse
-                        if verse_num == target_verse:
-                            # Construct reference in the format: "Book Title Chapter:Verse"
-                            reference = f"{book_title} {chapter_num}:{verse_num}"
-                            text = verse['text']
-                            # Remove verse number from the beginning of the text
-                            cleaned_text = self._remove_verse_number(text, verse_num)
-                            self.matching_passages[reference] = cleaned_text
+        # Remove verse number from the beginning of the text
+        passages = self.passage_index.get((target_chapter, target_verse), [])
+        self.matching_passages = {
+            reference: self._remove_verse_number(text, target_verse)
+            for reference, text in passages
+        }
+        
+        # Strip bracketed text once; both analysis passes work from this copy
+        self.cleaned_passages = {
+            reference: _BRACKET_RE.sub('', text)
+            for reference, text in self.matching_passages.items()
+        }
+        # Lower-case once as well, for the word counts and pattern matching
+        self.lowered_passages = {
+            reference: text.lower() for reference, text in self.cleaned_passages.items()
+        }
+        # Per-passage character and word counts, shared by both analysis passes
+        self.passage_lengths = list(map(len, self.cleaned_passages.values()))
+        self.word_counts = list(map(len, map(str.split, self.cleaned_passages.values())))
         
         print(f"✅ Found {len(self.matching_passages)} matching passages")
         return self.matching_passages
     
     def _remove_verse_number(self, text, verse_num):
         """Remove verse number from the beginning of verse text."""
-        # Pattern to match verse number at the beginning followed by optional space
-        verse_pattern = f"^{verse_num}\\s*"
-        import re
-        cleaned_text = re.sub(verse_pattern, '', text).strip()
-        return cleaned_text
+        # Literal prefix check; the whitespace after the number goes with strip()
+        verse_prefix = str(verse_num)
+        if text.startswith(verse_prefix):
+            text = text[len(verse_prefix):]
+        return text.strip()
     
     def analyze_seven_patterns(self):
         """Analyze ALL patterns related to the number 7 algorithmically, excluding bracketed text."""
         print("🔢 Analyzing comprehensive number 7 patterns...")
         
-        # Helper function to remove bracketed text
-        def remove_bracketed_text(text):
-            """Remove text within square brackets [...]"""
-            return re.sub(r'\[.*?\]', '', text)
-        
         seven_patterns = {
             'explicit_seven': [],
             'numbers_divisible_by_7': [],
@@ -120,89 +238,70 @@ class InteractiveBibleAnalytics:
             'ordinal_sevens': []
         }
         
-        # Define patterns algorithmically
-        seven_word_patterns = {
-            'basic': [r'\bseven\b', r'\bseventh\b', r'\bseventy\b', r'\bseventeen\b'],
-            'compounds': [r'\bseventy-seven\b', r'\bseven-fold\b', r'\bsevenfold\b'],
-            'related': [r'\bweek\b', r'\bsabbath\b', r'\bheptad\b', r'\brest\b']
-        }
-        
-        # Biblical seven terms (common in scripture)
-        biblical_terms = [
-            'seven days', 'seven years', 'seven times', 'seven lamps',
-            'seven spirits', 'seven churches', 'seven seals', 'seven trumpets',
-            'seven bowls', 'seven heads', 'seven horns', 'seven eyes',
-            'seven stars', 'seven candlesticks', 'seven angels', 'seven thunders'
-        ]
-        
-        # Ordinal numbers divisible by 7
-        ordinals_div_7 = [
-            'seventh', 'fourteenth', 'twenty-first', 'twenty-eighth',
-            'thirty-fifth', 'forty-second', 'forty-ninth', 'fifty-sixth',
-            'sixty-third', 'seventieth', 'seventy-seventh'
-        ]
-        
-        for reference, original_text in self.matching_passages.items():
-            # Remove bracketed text for analysis
-            text = remove_bracketed_text(original_text)
-            text_lower = text.lower()
+        for (reference, text), text_lower, char_count, word_count in zip(
+                self.cleaned_passages.items(), self.lowered_passages.values(),
+                self.passage_lengths, self.word_counts):
             
             # 1. Check reference for numbers divisible by 7
-            ref_numbers = re.findall(r'\d+', reference)
-            for num_str in ref_numbers:
-                num = int(num_str)
-                if num % 7 == 0 and num > 0:
+            for match in _INT_RE.finditer(reference):
+                num = int(match.group())
+                multiple, remainder = divmod(num, 7)
+                if remainder == 0 and num > 0:
                     seven_patterns['seven_in_reference'].append({
                         'reference': reference,
                         'number': num,
-                        'multiple': num // 7
+                        'multiple': multiple
                     })
             
             # 2. Find all numbers in text divisible by 7 (excluding bracketed text)
-            text_numbers = re.findall(r'\b\d+\b', text)
-            for num_str in text_numbers:
-                num = int(num_str)
-                if num % 7 == 0 and num > 0:
+            for match in _BOUNDED_INT_RE.finditer(text):
+                num = int(match.group())
+                multiple, remainder = divmod(num, 7)
+                if remainder == 0 and num > 0:
                     seven_patterns['numbers_divisible_by_7'].append({
                         'reference': reference,
                         'number': num,
-                        'multiple': num // 7,
-                        'context': self._get_context_around_number(text, num_str)
+                        'multiple': multiple,
+                        'context': self._get_context(text, match.start(), match.end())
                     })
             
             # 3. Check for seven-related word patterns (excluding bracketed text)
-            for category, patterns in seven_word_patterns.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, text_lower)
+            if _SEVEN_ANY_RE.search(text_lower):
+                for category, pattern in _SEVEN_PATTERNS:
+                    matches = pattern.findall(text_lower)
                     if matches:
                         seven_patterns['explicit_seven'].append({
                             'reference': reference,
                             'category': category,
-                            'pattern': pattern.replace('\\b', ''),
+                            'pattern': pattern.pattern.replace('\\b', ''),
                             'matches': matches,
                             'count': len(matches)
                         })
             
             # 4. Check for biblical seven terms (excluding bracketed text)
-            for term in biblical_terms:
-                if term in text_lower:
+            # First occurrence of each term, keeping the offsets for the context
+            found_terms = {}
+            for match in _BIBLICAL_SEVEN_TERMS_RE.finditer(text_lower):
+                found_terms.setdefault(match.group(), match.span())
+            for term in _BIBLICAL_SEVEN_TERMS:
+                if term in found_terms:
                     seven_patterns['biblical_seven_terms'].append({
                         'reference': reference,
                         'term': term,
-                        'context': self._get_context_around_term(text, term)
+                        'context': self._get_context(text, *found_terms[term])
                     })
             
             # 5. Check for ordinal numbers divisible by 7 (excluding bracketed text)
-            for ordinal in ordinals_div_7:
-                if ordinal in text_lower:
+            for ordinal in _ORDINALS_DIV_7:
+                index = text_lower.find(ordinal)
+                if index != -1:
                     seven_patterns['ordinal_sevens'].append({
                         'reference': reference,
                         'ordinal': ordinal,
-                        'context': self._get_context_around_term(text, ordinal)
+                        'context': self._get_context(text, index, index + len(ordinal))
                     })
             
             # 6. Character count analysis (excluding bracketed text)
-            char_count = len(text)
             if char_count % 7 == 0:
                 seven_patterns['character_count_seven'].append({
                     'reference': reference,
@@ -211,7 +310,6 @@ class InteractiveBibleAnalytics:
                 })
             
             # 7. Word count analysis (excluding bracketed text)
-            word_count = len(text.split())
             if word_count % 7 == 0:
                 seven_patterns['word_count_seven'].append({
                     'reference': reference,
@@ -230,12 +328,13 @@ class InteractiveBibleAnalytics:
                 })
         
         # 9. Mathematical patterns across all passages (excluding bracketed text)
-        cleaned_texts = [remove_bracketed_text(text) for text in self.matching_passages.values()]
-        all_text = ' '.join(cleaned_texts)
+        # Totals are taken from the per-passage counts instead of joining and
+        # re-splitting every passage
         mathematical_sevens = []
         
-        # Total character count (excluding bracketed text)
-        total_chars = len(all_text)
+        # Total character count (excluding bracketed text), counting the
+        # single space that separates consecutive passages
+        total_chars = sum(self.passage_lengths) + max(len(self.passage_lengths) - 1, 0)
         if total_chars % 7 == 0:
             mathematical_sevens.append({
                 'type': 'combined_character_count',
@@ -244,7 +343,7 @@ class InteractiveBibleAnalytics:
             })
         
         # Total word count (excluding bracketed text)
-        total_words = len(all_text.split())
+        total_words = sum(self.word_counts)
         if total_words % 7 == 0:
             mathematical_sevens.append({
                 'type': 'combined_word_count',
@@ -280,30 +379,20 @@ class InteractiveBibleAnalytics:
         
         return self.seven_patterns
     
-    def _get_context_around_number(self, text, number_str):
-        """Get 60 characters of context around a number."""
-        index = text.find(number_str)
-        if index != -1:
-            start = max(0, index - 30)
-            end = min(len(text), index + len(number_str) + 30)
-            return text[start:end].strip()
-        return text[:60] + "..." if len(text) > 60 else text
-    
-    def _get_context_around_term(self, text, term):
-        """Get 60 characters of context around a term."""
-        index = text.lower().find(term.lower())
-        if index != -1:
-            start = max(0, index - 30)
-            end = min(len(text), index + len(term) + 30)
-            return text[start:end].strip()
-        return text[:60] + "..." if len(text) > 60 else text
+    def _get_context(self, text, start, end):
+        """Get 60 characters of context around the match at text[start:end]."""
+        return text[max(0, start - 30):end + 30].strip()
+
+    def _count_punctuation(self, text):
+        """Count characters that are neither word characters nor whitespace."""
+        if text.isascii():
+            return len(text) - len(text.translate(_NON_WORD_SPACE_DELETE))
+        return len(_NON_WORD_SPACE_RE.findall(text))
 
     def identify_all_books(self):
         """Identifies all unique book names present in the loaded Bible data."""
         print("📚 Identifying all unique books in the Bible...")
-        self.all_books = set()
-        for book in self.bible_data['books']:
-            self.all_books.add(book['title'])
+        self.all_books = set(self.book_titles)
         print(f"✅ Identified {len(self.all_books)} unique books.")
 
     def analyze_matching_passages(self):
@@ -314,83 +403,74 @@ class InteractiveBibleAnalytics:
         print(f"📊 Analyzing {len(self.matching_passages)} matching passages...")
 
         # Identify books that contain the target passage
-        self.books_with_target = set()
-        for reference in self.matching_passages.keys():
-            # Extract book title from reference (everything before the last space and colon)
-            # Format: "Book Title Chapter:Verse"
-            parts = reference.split(':')
-            if len(parts) >= 2:
-                book_chapter_part = parts[0]
-                book_name_parts = book_chapter_part.split()
-                if len(book_name_parts) > 1 and book_name_parts[-1].isdigit():
-                    book_name = ' '.join(book_name_parts[:-1])
-                else:
-                    book_name = book_chapter_part
-                self.books_with_target.add(book_name)
-
-        # Identify books that do not contain the target passage
-        self.books_without_target = self.all_books - self.books_with_target
-
-        # Helper function to remove bracketed text
-        def remove_bracketed_text(text):
-            """Remove text within square brackets [...]"""
-            return re.sub(r'\[.*?\]', '', text)
+        self.books_with_target = {
+            self.parsed_references[reference][0] for reference in self.matching_passages
+        }
+
+        # Identify books that do not contain the target passage, in Bible order
+        self.books_without_target = [
+            book_title for book_title in self.book_titles
+            if book_title not in self.books_with_target
+        ]
 
         # Basic text statistics (ONLY for matching passages, excluding bracketed text)
-        cleaned_texts = [remove_bracketed_text(text) for text in self.matching_passages.values()]
-        total_chars = sum(len(text) for text in cleaned_texts)
-        total_words = sum(len(text.split()) for text in cleaned_texts)
-        total_sentences = sum(len(re.split(r'[.!?]+', text)) for text in cleaned_texts)
-        
-        # Find extremes (ONLY for matching passages, excluding bracketed text)
-        cleaned_passages = {ref: remove_bracketed_text(text) for ref, text in self.matching_passages.items()}
-        longest_passage = max(cleaned_passages.items(), key=lambda x: len(x[1]))
-        shortest_passage = min(cleaned_passages.items(), key=lambda x: len(x[1]))
-        
-        longest_by_words = max(cleaned_passages.items(), key=lambda x: len(x[1].split()))
-        shortest_by_words = min(cleaned_passages.items(), key=lambda x: len(x[1].split()))
+        # Per-passage lengths and extremes are gathered in the same pass
+        total_chars = sum(self.passage_lengths)
+        total_words = sum(self.word_counts)
+        total_sentences = 0
+        punctuation_count = 0
+        longest_passage = shortest_passage = longest_by_words = shortest_by_words = None
+        max_chars = min_chars = max_words = min_words = 0
+        word_frequency = Counter()
+        char_frequency = Counter()
+        for (reference, text), text_lower, char_count, word_count in zip(
+                self.cleaned_passages.items(), self.lowered_passages.values(),
+                self.passage_lengths, self.word_counts):
+            total_sentences += len(_SENTENCE_SPLIT_RE.split(text))
+            punctuation_count += self._count_punctuation(text)
+            
+            # Word and character analysis, counted per passage rather than
+            # over one joined copy of every passage
+            word_frequency.update(_WORD_RE.findall(text_lower))
+            char_frequency.update(text_lower)
+            
+            # Find extremes (first passage wins ties, as with max/min)
+            if longest_passage is None or char_count > max_chars:
+                longest_passage, max_chars = (reference, text), char_count
+            if shortest_passage is None or char_count < min_chars:
+                shortest_passage, min_chars = (reference, text), char_count
+            if longest_by_words is None or word_count > max_words:
+                longest_by_words, max_words = (reference, text), word_count
+            if shortest_by_words is None or word_count < min_words:
+                shortest_by_words, min_words = (reference, text), word_count
         
         # Word analysis (ONLY for matching passages, excluding bracketed text)
-        all_words = []
-        for text in cleaned_texts:
-            words = re.findall(r'\b\w+\b', text.lower())
-            all_words.extend(words)
-        
-        word_frequency = Counter(all_words)
         most_common_words = word_frequency.most_common(15)
-        unique_words = len(set(all_words))
+        unique_words = len(word_frequency)
         
         # Character analysis (ONLY for matching passages, excluding bracketed text)
-        all_chars = ''.join(cleaned_texts)
-        char_frequency = Counter(all_chars.lower())
         most_common_chars = char_frequency.most_common(10)
         
-        # Punctuation analysis (ONLY for matching passages, excluding bracketed text)
-        punctuation_count = sum(len(re.findall(r'[^\w\s]', text)) for text in cleaned_texts)
-        
         # Length distribution analysis (ONLY for matching passages, excluding bracketed text)
-        passage_lengths = [len(text) for text in cleaned_texts]
-        word_counts = [len(text.split()) for text in cleaned_texts]
-        
         # Calculate percentiles
-        passage_lengths.sort()
-        word_counts.sort()
-        
-        def percentile(data, p):
-            if not data:
-                return 0
-            k = (len(data) - 1) * p / 100
-            f = int(k)
-            c = k - f
-            if f + 1 < len(data):
-                return data[f] * (1 - c) + data[f + 1] * c
-            return data[f]
+        passage_lengths = sorted(self.passage_lengths)
+        word_counts = sorted(self.word_counts)
+        
+        def quartiles(data):
+            """Return the 25th, 50th and 75th percentiles in one call."""
+            if len(data) < 2:
+                return [data[0]] * 3 if data else [0, 0, 0]
+            return statistics.quantiles(data, n=4, method='inclusive')
+        
+        char_quartiles = quartiles(passage_lengths)
+        word_quartiles = quartiles(word_counts)
         
         # Text complexity analysis (ONLY for matching passages, excluding bracketed text)
         avg_sentence_length = total_words / total_sentences if total_sentences > 0 else 0
         
         # Special character analysis (ONLY for matching passages, excluding bracketed text)
-        special_chars = sum(len(re.findall(r'[^\w\s]', text)) for text in cleaned_texts)
+        # Special characters are the same [^\w\s] class as punctuation
+        special_chars = punctuation_count
         
         self.analytics = {
             'target_info': {
@@ -429,8 +509,11 @@ class InteractiveBibleAnalytics:
                 'char_frequency': char_frequency
             },
             'book_analysis': {
-                'books_with_passage': list(self.books_with_target),
-                'books_without_passage': list(self.books_without_target),
+                'books_with_passage': [
+                    book_title for book_title in self.book_titles
+                    if book_title in self.books_with_target
+                ],
+                'books_without_passage': self.books_without_target,
                 'total_books_in_bible': len(self.all_books),
                 'books_with_target_count': len(self.books_with_target),
                 'books_without_target_count': len(self.books_without_target)
@@ -439,12 +522,12 @@ class InteractiveBibleAnalytics:
                 'passage_lengths': passage_lengths,
                 'word_counts': word_counts,
                 'percentiles': {
-                    '25th_char': percentile(passage_lengths, 25),
-                    '50th_char': percentile(passage_lengths, 50),
-                    '75th_char': percentile(passage_lengths, 75),
-                    '25th_word': percentile(word_counts, 25),
-                    '50th_word': percentile(word_counts, 50),
-                    '75th_word': percentile(word_counts, 75)
+                    '25th_char': char_quartiles[0],
+                    '50th_char': char_quartiles[1],
+                    '75th_char': char_quartiles[2],
+                    '25th_word': word_quartiles[0],
+                    '50th_word': word_quartiles[1],
+                    '75th_word': word_quartiles[2]
                 }
             }
         }
@@ -532,6 +615,16 @@ class InteractiveBibleAnalytics:
 
     def display_comprehensive_analysis(self):
         """Display comprehensive analysis results."""
+        # The report runs to hundreds of lines; render it in memory and write it
+        # to the terminal in one call instead of one write per print()
+        report = io.StringIO()
+        with contextlib.redirect_stdout(report):
+            self._print_comprehensive_analysis()
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+    
+    def _print_comprehensive_analysis(self):
+        """Print comprehensive analysis results."""
         if not self.matching_passages:
             print(f"❌ No passages found for Chapter {self.target_chapter}, Verse {self.target_verse}")
             return
@@ -650,10 +743,13 @@ class InteractiveBibleAnalytics:
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # JSON files are machine-readable, so they are written compactly;
+        # the text summary below is the human-readable report
+        
         # Save matching passages
         passages_file = f"{output_dir}chapter_{self.target_chapter}_verse_{self.target_verse}_passages_{timestamp}.json"
         with open(passages_file, 'w', encoding='utf-8') as f:
-            json.dump(self.matching_passages, f, indent=2, ensure_ascii=False)
+            json.dump(self.matching_passages, f, ensure_ascii=False, separators=(',', ':'))
         print(f" Passages saved to: {passages_file}")
         
         # Save comprehensive analytics
@@ -664,48 +760,69 @@ class InteractiveBibleAnalytics:
                 'verse': self.target_verse,
                 'timestamp': datetime.now().isoformat()
             },
-            'passages': self.matching_passages,
+            # Passages are written once, to the passages file above
+            'passages_file': passages_file,
             'analytics': self.analytics
         }
         
         with open(analytics_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+            json.dump(report_data, f, ensure_ascii=False, separators=(',', ':'))
         print(f"💾 Analytics report saved to: {analytics_file}")
         
         # Save summary report
         summary_file = f"{output_dir}chapter_{self.target_chapter}_verse_{self.target_verse}_summary_{timestamp}.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"BIBLE ANALYTICS SUMMARY\n")
-            f.write(f"Chapter {self.target_chapter}, Verse {self.target_verse}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("="*50 + "\n\n")
+        # Assemble the whole summary first so it is written in one call
+        stats = self.analytics['basic_stats']
+        avgs = self.analytics['averages']
+        parts = [
+            f"BIBLE ANALYTICS SUMMARY\n",
+            f"Chapter {self.target_chapter}, Verse {self.target_verse}\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "="*50 + "\n\n",
             
-            f.write(f"Total Passages Found: {self.analytics['basic_stats']['total_passages']}\n")
-            f.write(f"Total Characters: {self.analytics['basic_stats']['total_characters']:,}\n")
-            f.write(f"Total Words: {self.analytics['basic_stats']['total_words']:,}\n")
-            f.write(f"Average Length: {self.analytics['averages']['avg_chars_per_passage']:.1f} characters\n")
-            f.write(f"Average Words: {self.analytics['averages']['avg_words_per_passage']:.1f}\n\n")
+            f"Total Passages Found: {stats['total_passages']}\n",
+            f"Total Characters: {stats['total_characters']:,}\n",
+            f"Total Words: {stats['total_words']:,}\n",
+            f"Average Length: {avgs['avg_chars_per_passage']:.1f} characters\n",
+            f"Average Words: {avgs['avg_words_per_passage']:.1f}\n\n",
             
-            f.write("PASSAGES:\n")
-            f.write("-"*20 + "\n")
-            for reference, text in self.matching_passages.items():
-                f.write(f"{reference}: {text}\n")
+            "PASSAGES:\n",
+            "-"*20 + "\n"
+        ]
+        parts.extend(f"{reference}: {text}\n" for reference, text in self.matching_passages.items())
+        
+        # Encode once and write the bytes directly, bypassing the text layer
+        with open(summary_file, 'wb', buffering=1 << 20) as f:
+            f.write("".join(parts).encode('utf-8'))
         
         print(f"💾 Summary report saved to: {summary_file}")
 
 
-def load_bible_data(bible_json_path):
-    """Load Bible data from JSON file."""
+def load_bible_data(bible_json_path, fd=None):
+    """Load Bible data from JSON file, or from an already open descriptor for it."""
     try:
         print(f" Loading Bible data from: {bible_json_path}")
-        with open(bible_json_path, 'r', encoding='utf-8') as file:
-            bible_data = json.load(file)
+        with open(bible_json_path if fd is None else fd, 'rb', closefd=fd is None) as file:
+            # Only non-empty regular files can be mapped; pipes and empty files are read
+            file_stat = os.fstat(file.fileno())
+            if orjson is not None and stat.S_ISREG(file_stat.st_mode) and file_stat.st_size:
+                # Parse straight from the mapped file instead of copying it into a buffer
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # Ask the kernel to read ahead while the parser works (Linux)
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    if hasattr(mmap, 'MADV_WILLNEED'):
+                        mapped.madvise(mmap.MADV_WILLNEED)
+                    with memoryview(mapped) as view:
+                        bible_data = orjson.loads(view)
+            else:
+                bible_data = json.loads(file.read())
         print(f"✅ Successfully loaded {len(bible_data):,} verses")
         return bible_data
     except FileNotFoundError:
         print(f"❌ Error: File '{bible_json_path}' not found.")
         return None
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
         print(f"❌ Error: Invalid JSON format: {e}")
         return None
     except Exception as e:
@@ -713,6 +830,63 @@ def load_bible_data(bible_json_path):
         return None
 
 
+def _source_stamp(source_stat):
+    """Identify a version of the Bible JSON by its exact size and modification time."""
+    return (source_stat.st_size, source_stat.st_mtime_ns)
+
+
+def load_index_cache(bible_json_path, source_stat):
+    """Load the cached passage index if it was built from this exact Bible JSON file."""
+    cache_path = f"{bible_json_path}.cache.pkl"
+    try:
+        with open(cache_path, 'rb') as file:
+            version, source_stamp, index = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable index cache '{cache_path}': {e}")
+        return None
+    # Any change in size or mtime, including an older mtime restored by
+    # cp -p, tar or rsync -t, means the cache may describe another file
+    if version != _INDEX_CACHE_VERSION or source_stamp != _source_stamp(source_stat):
+        return None
+    print(f"✅ Loaded cached index from: {cache_path}")
+    return index
+
+
+def save_index_cache(bible_json_path, source_stat, analytics):
+    """Save the passage index next to the Bible JSON file for later runs."""
+    cache_path = f"{bible_json_path}.cache.pkl"
+    index = (analytics.parsed_references, analytics.book_titles, analytics.passage_index)
+    payload = (_INDEX_CACHE_VERSION, _source_stamp(source_stat), index)
+    temp_path = None
+    try:
+        # Write to a temporary file and swap it in, so an interrupted or
+        # concurrent run never leaves a truncated cache behind
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f"{os.path.basename(cache_path)}.",
+            suffix='.tmp',
+            dir=os.path.dirname(os.path.abspath(cache_path))
+        )
+        with open(fd, 'wb') as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # mkstemp creates the file as 0600; give the cache the permissions a
+        # plain open() would, so other users sharing the directory can read it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, cache_path)
+        temp_path = None
+    except Exception as e:
+        print(f"⚠️ Could not write index cache '{cache_path}': {e}")
+    finally:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
 def main():
     """Main function to execute the interactive analytics script."""
     print("🚀 Interactive Bible Verse Analytics")
@@ -722,45 +896,81 @@ def main():
     script_dir = Path(__file__).parent
     default_bible_path = script_dir / "bible.json"
     
+    # --no-cache forces the Bible JSON to be parsed and indexed again
+    args = sys.argv[1:]
+    use_cache = '--no-cache' not in args
+    args = [arg for arg in args if arg != '--no-cache']
+    
     # Check if a custom path was provided as command line argument
-    if len(sys.argv) > 1:
-        bible_json_path = sys.argv[1]
+    if args:
+        bible_json_path = args[0]
     else:
         bible_json_path = str(default_bible_path)
     
-    # Verify the file exists
-    if not Path(bible_json_path).exists():
+    # Open the file once; this also verifies it exists
+    try:
+        bible_fd = os.open(bible_json_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except FileNotFoundError:
         print(f"❌ Error: Bible JSON file not found at '{bible_json_path}'")
-        print("Usage: python countverse.py [path_to_bible.json]")
+        print("Usage: python countverse.py [--no-cache] [path_to_bible.json]")
         sys.exit(1)
-    
-    # Load Bible data
-    bible_data = load_bible_data(bible_json_path)
-    if not bible_data:
-        sys.exit(1)
-    
-    # Initialize analytics
-    analytics = InteractiveBibleAnalytics(bible_data)
-    
-    # Get user input
-    if not analytics.get_user_input():
+    except OSError as e:
+        print(f"❌ Error reading file: {e}")
         sys.exit(1)
     
-    # Perform analysis
+    try:
+        # os.open also succeeds on directories, which cannot hold Bible data
+        source_stat = os.fstat(bible_fd)
+        if stat.S_ISDIR(source_stat.st_mode):
+            print(f"❌ Error: '{bible_json_path}' is a directory, not a Bible JSON file")
+            print("Usage: python countverse.py [--no-cache] [path_to_bible.json]")
+            sys.exit(1)
+        # Pipes and devices have no stable size or mtime to key the cache on
+        use_cache = use_cache and stat.S_ISREG(source_stat.st_mode)
+
+        # Reuse the index from an earlier run when the JSON has not changed
+        index = load_index_cache(bible_json_path, source_stat) if use_cache else None
+        if index is not None:
+            analytics = InteractiveBibleAnalytics(None, index=index)
+        else:
+            # Load Bible data
+            bible_data = load_bible_data(bible_json_path, bible_fd)
+            if not bible_data:
+                sys.exit(1)
+            
+            # Initialize analytics (references are parsed and indexed once, here)
+            analytics = InteractiveBibleAnalytics(bible_data)
+            # The index holds everything the queries need; release the decoded document
+            del bible_data
+            if use_cache:
+                save_index_cache(bible_json_path, source_stat, analytics)
+    finally:
+        os.close(bible_fd)
     analytics.identify_all_books()
-    analytics.extract_matching_passages()
-    analytics.analyze_matching_passages()
-    analytics.analyze_seven_patterns()
-    
-    # Display results
-    analytics.display_comprehensive_analysis()
-    
-    # Save reports
-    analytics.save_analysis_report()
     
-    print("\n🎉 Analysis complete!")
-    print(f" Analyzed Chapter {analytics.target_chapter}, Verse {analytics.target_verse}")
-    print(f"📈 Found {len(analytics.matching_passages)} matching passages")
+    # Reuse the same indexed data for every query
+    while True:
+        # Get user input
+        if not analytics.get_user_input():
+            sys.exit(1)
+        
+        # Perform analysis
+        analytics.extract_matching_passages()
+        analytics.analyze_matching_passages()
+        analytics.analyze_seven_patterns()
+        
+        # Display results
+        analytics.display_comprehensive_analysis()
+        
+        # Save reports
+        analytics.save_analysis_report()
+        
+        print("\n🎉 Analysis complete!")
+        print(f" Analyzed Chapter {analytics.target_chapter}, Verse {analytics.target_verse}")
+        print(f"📈 Found {len(analytics.matching_passages)} matching passages")
+        
+        if not analytics.ask_another_query():
+            break
 
 
 if __name__ == "__main__":